@@ -14,6 +14,52 @@ import zipfile
 from tkinter import font as tkfont
 import sv_ttk
 import json
+import time
+import io
+import cProfile
+import pstats
+import tracemalloc
+import contextlib
+import collections
+import copy
+import queue
+from datetime import datetime
+
+
+VIDEO_QUALITIES = ["4K", "1440p", "1080p", "720p", "480p", "360p"]
+VIDEO_QUALITY_HEIGHTS = {"4K": 2160, "1440p": 1440, "1080p": 1080, "720p": 720, "480p": 480, "360p": 360}
+JOB_STATES = ["queued", "downloading", "processing", "done", "failed", "cancelled"]
+JOB_COLUMNS = [
+    ('title', "Title", 320),
+    ('format', "Format", 70),
+    ('quality', "Quality", 70),
+    ('state', "State", 100),
+    ('progress', "Progress", 80),
+]
+# Rows are inserted into the job table in chunks so large batches don't block the Tk event loop
+JOB_ROW_CHUNK = 500
+JOB_FLUSH_INTERVAL = 200
+# Metadata is prefetched once the URL field has been idle this long (ms); cached entries expire
+# well before the signed stream URLs inside them do
+PREFETCH_DELAY = 500
+INFO_CACHE_TTL = 30 * 60
+INFO_CACHE_SIZE = 50
+MAX_INFO_REDIRECTS = 5
+# FFmpeg is only killed when its -progress output stops changing for this long (seconds)
+FFMPEG_STALL_TIMEOUT = 60
+FFMPEG_STDERR_LINES = 200
+
+
+def format_size(num_bytes):
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+
+class FFmpegAborted(Exception):
+    pass
 
 
 class FFmpegManager:
@@ -140,6 +186,148 @@ class FFmpegManager:
             return False, f"Linux FFmpeg installation failed: {str(e)}"
 
 
+class DownloadJob:
+    def __init__(self, job_id, url, output_path, format_type, quality, profile=False,
+                 audio_format='mp3', thumbnail=False):
+        self.id = job_id
+        self.url = url
+        self.title = url
+        self.output_path = output_path
+        self.format_type = format_type
+        self.quality = quality
+        self.profile = profile
+        self.audio_format = audio_format
+        self.thumbnail = thumbnail
+        self.state = 'queued'
+        self.progress = 0.0
+        self.message = ''
+        self.cancel_requested = False
+    
+    def format_label(self):
+        if self.format_type == "both":
+            label = f"MP4+{self.audio_format.upper()}"
+            return f"{label}+JPG" if self.thumbnail else label
+        return self.format_type.upper()
+    
+    def row_values(self):
+        return (self.title, self.format_label(), self.quality or '-',
+                self.state.capitalize(), f"{self.progress:.0f}%")
+
+
+class JobProfiler:
+    def __init__(self, job_name, report_dir):
+        self.job_name = job_name
+        self.report_dir = report_dir
+        self.phases = []
+        self.ffmpeg_runs = []
+        self.profile = cProfile.Profile()
+        self.started_at = None
+        self.elapsed = 0.0
+        self.memory_current = 0
+        self.memory_peak = 0
+    
+    def start(self):
+        self.started_at = time.perf_counter()
+        tracemalloc.start()
+        self.profile.enable()
+    
+    def stop(self):
+        self.profile.disable()
+        self.elapsed = time.perf_counter() - self.started_at
+        self.memory_current, peak = tracemalloc.get_traced_memory()
+        # Phases reset the peak counter, so the job-wide peak is the largest one seen
+        self.memory_peak = max([peak] + [phase[3] for phase in self.phases])
+        tracemalloc.stop()
+    
+    @contextlib.contextmanager
+    def phase(self, name):
+        # Memory is only sampled at phase boundaries; per-line snapshots would add even more
+        # tracing work on top of the profile
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            self.phases.append((name, seconds, current, peak))
+    
+    def record_ffmpeg(self, label, cmd, result, elapsed):
+        # -benchmark writes "bench: utime=... stime=... rtime=..." and "bench: maxrss=..." to stderr
+        bench = {}
+        for line in (result.stderr or '').splitlines():
+            if line.startswith('bench:'):
+                for field in line[len('bench:'):].split():
+                    key, _, value = field.partition('=')
+                    bench[key] = value
+        
+        # -progress emits key=value blocks on stdout; keep the last value of each key
+        progress = {}
+        for line in (result.stdout or '').splitlines():
+            key, sep, value = line.partition('=')
+            if sep:
+                progress[key.strip()] = value.strip()
+        
+        self.ffmpeg_runs.append({
+            'label': label,
+            'cmd': cmd,
+            'returncode': result.returncode,
+            'elapsed': elapsed,
+            'bench': bench,
+            'progress': progress,
+        })
+    
+    def write_report(self, status):
+        os.makedirs(self.report_dir, exist_ok=True)
+        safe_name = re.sub(r'[^\w.-]+', '_', self.job_name)[:80]
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        report_path = os.path.join(self.report_dir, f'{timestamp}_{safe_name}.txt')
+        
+        lines = [
+            "Tube UI profile report",
+            f"Job: {self.job_name}",
+            f"Status: {status}",
+            f"Total wall time: {self.elapsed:.3f}s",
+            "Note: timings were taken with tracemalloc enabled, so allocation-heavy Python code",
+            "appears slower than it runs without profiling. FFmpeg times are unaffected.",
+            "",
+            "Phases:",
+        ]
+        for name, seconds, current, peak in self.phases:
+            lines.append(f"  {name:<16} {seconds:9.3f}s  memory={current / 1024:.1f} KiB "
+                         f"peak={peak / 1024:.1f} KiB")
+        
+        lines.append("")
+        lines.append("FFmpeg subprocesses:")
+        if not self.ffmpeg_runs:
+            lines.append("  (none)")
+        for run in self.ffmpeg_runs:
+            bench = run['bench']
+            progress = run['progress']
+            lines.append(f"  {run['label']}: exit={run['returncode']} wall={run['elapsed']:.3f}s")
+            lines.append(f"    utime={bench.get('utime', '?')} stime={bench.get('stime', '?')} "
+                         f"rtime={bench.get('rtime', '?')} maxrss={bench.get('maxrss', '?')}")
+            lines.append(f"    speed={progress.get('speed', '?')} out_time={progress.get('out_time', '?')} "
+                         f"frames={progress.get('frame', '?')} fps={progress.get('fps', '?')}")
+            lines.append(f"    cmd: {subprocess.list2cmdline(run['cmd'])}")
+        
+        lines.append("")
+        lines.append(f"Python memory: current={self.memory_current / 1024:.1f} KiB "
+                     f"peak={self.memory_peak / 1024:.1f} KiB")
+        
+        stats_stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stats_stream)
+        stats.sort_stats('cumulative').print_stats(40)
+        lines.append("")
+        lines.append("Python profile (cumulative, top 40):")
+        lines.append(stats_stream.getvalue())
+        
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+        
+        return report_path
+
+
 class TubeUI:
     def __init__(self, root):
         self.root = root
@@ -150,6 +338,8 @@ class TubeUI:
         self.root.iconbitmap(default='')
         
         self.settings_file = os.path.join(os.path.dirname(__file__), 'settings.json')
+        # Not next to __file__: the --onefile build unpacks there into a temp folder deleted on exit
+        self.profiles_dir = os.path.join(os.path.expanduser("~"), 'TubeUI', 'profiles')
         self.load_settings()
         
         # Set initial theme
@@ -158,19 +348,42 @@ class TubeUI:
         sv_ttk.set_theme(initial_theme)
         self.update_window_titlebar_color(initial_theme)
         
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
-        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.root.winfo_screenheight() // 2) - (height // 2)
-        self.root.geometry(f'{width}x{height}+{x}+{y}')
-        
         self.download_path = os.path.expanduser("~/Downloads")
         self.is_downloading = False
         self.ffmpeg_manager = FFmpegManager()
+        self.profiler = None
+        
+        self.jobs = {}
+        self.job_order = []
+        self.pending_jobs = collections.deque()
+        self.jobs_lock = threading.Lock()
+        self.next_job_id = 1
+        self.current_job = None
+        self.run_counts = collections.Counter()
+        self.last_message = None
+        
+        # Job table bookkeeping: rows in the current view, last drawn values, and rows awaiting a redraw
+        self.view_ids = set()
+        self.view_order = []
+        self.rows_inserted = 0
+        self.row_values = {}
+        self.dirty_jobs = set()
+        self.stale_rows = set()
+        self.view_generation = 0
+        self.sort_column = None
+        self.sort_reverse = False
+        
+        self.info_cache = collections.OrderedDict()
+        self.info_cache_lock = threading.Lock()
+        self.info_fetches = {}
+        self.prefetch_after_id = None
+        self.prefetch_generation = 0
+        self.prefetched_info = None
         
         self.setup_ui()
+        self.fit_window_to_screen()
         self.check_ffmpeg_availability()
+        self.root.after(JOB_FLUSH_INTERVAL, self.flush_job_updates)
         
         # Apply title bar color after window is fully shown
         self.root.after(100, lambda: self.update_window_titlebar_color(self.theme_mode))
@@ -190,7 +403,7 @@ class TubeUI:
     
     def save_settings(self):
         try:
-            settings = {'theme': self.theme_mode}
+            settings = {'theme': self.theme_mode, 'profiling': self.profiling_var.get()}
             with open(self.settings_file, 'w') as f:
                 json.dump(settings, f)
         except:
@@ -254,16 +467,27 @@ class TubeUI:
         # Force immediate update of title bar color
         self.root.after(50, lambda: self.update_window_titlebar_color(self.theme_mode))
     
+    def fit_window_to_screen(self):
+        # Grow to the layout's requested height when needed, but never past the screen
+        self.root.update_idletasks()
+        screen_height = self.root.winfo_screenheight()
+        width = self.root.winfo_width()
+        height = min(max(self.root.winfo_height(), self.root.winfo_reqheight()), screen_height - 80)
+        x = (self.root.winfo_screenwidth() // 2) - (width // 2)
+        y = max(0, (screen_height // 2) - (height // 2) - 20)
+        self.root.geometry(f'{width}x{height}+{x}+{y}')
+    
     def setup_ui(self):
-        main_container = ttk.Frame(self.root, padding="40")
+        main_container = ttk.Frame(self.root, padding="20")
         main_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
         main_container.columnconfigure(0, weight=1)
+        main_container.rowconfigure(1, weight=1)
         
         header_frame = ttk.Frame(main_container)
-        header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 40))
+        header_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         header_frame.columnconfigure(0, weight=0)
         header_frame.columnconfigure(1, weight=1)
         
@@ -273,18 +497,36 @@ class TubeUI:
         title_label = ttk.Label(header_frame, text="Tube UI", font=('Segoe UI', 24, 'bold'))
         title_label.grid(row=0, column=1, sticky=tk.W)
         
-        url_frame = ttk.Frame(main_container, padding="20")
-        url_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
+        # The job table gets its own tab so it has the full window height regardless of the form
+        self.notebook = ttk.Notebook(main_container)
+        self.notebook.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        download_tab = ttk.Frame(self.notebook, padding="10")
+        download_tab.columnconfigure(0, weight=1)
+        self.notebook.add(download_tab, text="Download")
+        
+        self.jobs_tab = ttk.Frame(self.notebook, padding="10")
+        self.jobs_tab.columnconfigure(0, weight=1)
+        self.jobs_tab.rowconfigure(1, weight=1)
+        self.notebook.add(self.jobs_tab, text="Jobs")
+        
+        url_frame = ttk.Frame(download_tab, padding="10")
+        url_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         url_frame.columnconfigure(0, weight=1)
         
         url_label = ttk.Label(url_frame, text="Video URL", font=('Segoe UI', 11))
-        url_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 10))
+        url_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
         
-        self.url_entry = ttk.Entry(url_frame, font=('Segoe UI', 11))
+        self.url_var = tk.StringVar()
+        self.url_var.trace_add('write', self.on_url_change)
+        self.url_entry = ttk.Entry(url_frame, textvariable=self.url_var, font=('Segoe UI', 11))
         self.url_entry.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
-        options_frame = ttk.Frame(main_container, padding="20")
-        options_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
+        self.video_info_label = ttk.Label(url_frame, text="", font=('Segoe UI', 9))
+        self.video_info_label.grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
+        
+        options_frame = ttk.Frame(download_tab, padding="10")
+        options_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         options_frame.columnconfigure(1, weight=1)
         
         format_label = ttk.Label(options_frame, text="Format", font=('Segoe UI', 11))
@@ -299,7 +541,10 @@ class TubeUI:
         mp4_radio.pack(side=tk.LEFT, padx=(0, 20))
         mp3_radio = ttk.Radiobutton(format_frame, text="MP3 Audio", variable=self.format_var, value="mp3",
                                    command=self.on_format_change)
-        mp3_radio.pack(side=tk.LEFT)
+        mp3_radio.pack(side=tk.LEFT, padx=(0, 20))
+        both_radio = ttk.Radiobutton(format_frame, text="MP4 + Audio", variable=self.format_var, value="both",
+                                    command=self.on_format_change)
+        both_radio.pack(side=tk.LEFT)
         
         self.quality_label = ttk.Label(options_frame, text="Quality", font=('Segoe UI', 11))
         self.quality_label.grid(row=1, column=0, sticky=tk.W, pady=(10, 0))
@@ -309,16 +554,40 @@ class TubeUI:
         
         self.quality_var = tk.StringVar(value="1080p")
         self.quality_combo = ttk.Combobox(self.quality_frame, textvariable=self.quality_var, 
-                                        values=["4K", "1440p", "1080p", "720p", "480p", "360p"], 
+                                        values=VIDEO_QUALITIES, 
                                         state="readonly", width=18)
         self.quality_combo.pack(side=tk.LEFT)
+        self.quality_combo.bind('<<ComboboxSelected>>', lambda e: self.show_video_info())
+        
+        self.extra_outputs_label = ttk.Label(options_frame, text="Audio", font=('Segoe UI', 11))
+        self.extra_outputs_label.grid(row=2, column=0, sticky=tk.W, pady=(10, 0))
+        
+        self.extra_outputs_frame = ttk.Frame(options_frame)
+        self.extra_outputs_frame.grid(row=2, column=1, sticky=tk.W, pady=(10, 0), padx=(40, 0))
+        
+        self.audio_format_var = tk.StringVar(value="mp3")
+        audio_format_combo = ttk.Combobox(self.extra_outputs_frame, textvariable=self.audio_format_var,
+                                          values=["mp3", "m4a"], state="readonly", width=8)
+        audio_format_combo.pack(side=tk.LEFT, padx=(0, 20))
+        
+        self.thumbnail_var = tk.BooleanVar(value=False)
+        thumbnail_check = ttk.Checkbutton(self.extra_outputs_frame, text="Thumbnail", variable=self.thumbnail_var)
+        thumbnail_check.pack(side=tk.LEFT)
         
-        path_frame = ttk.Frame(main_container, padding="20")
-        path_frame.grid(row=4, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
+        self.extra_outputs_label.grid_remove()
+        self.extra_outputs_frame.grid_remove()
+        
+        self.profiling_var = tk.BooleanVar(value=bool(self.settings.get('profiling', False)))
+        profiling_check = ttk.Checkbutton(options_frame, text="Profile jobs (writes a report per download)",
+                                          variable=self.profiling_var, command=self.save_settings)
+        profiling_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=(10, 0))
+        
+        path_frame = ttk.Frame(download_tab, padding="10")
+        path_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         path_frame.columnconfigure(0, weight=1)
         
         path_label = ttk.Label(path_frame, text="Download Location", font=('Segoe UI', 11))
-        path_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 10))
+        path_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
         
         path_input_frame = ttk.Frame(path_frame)
         path_input_frame.grid(row=1, column=0, sticky=(tk.W, tk.E))
@@ -331,22 +600,22 @@ class TubeUI:
         browse_button = ttk.Button(path_input_frame, text="Browse", command=self.browse_path)
         browse_button.grid(row=0, column=1)
         
-        progress_frame = ttk.Frame(main_container, padding="20")
-        progress_frame.grid(row=5, column=0, sticky=(tk.W, tk.E), pady=(0, 20))
+        progress_frame = ttk.Frame(download_tab, padding="10")
+        progress_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
         progress_frame.columnconfigure(0, weight=1)
         
         progress_label = ttk.Label(progress_frame, text="Download Progress", font=('Segoe UI', 11))
-        progress_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 10))
+        progress_label.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
         
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(progress_frame, variable=self.progress_var, maximum=100)
         self.progress_bar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
-        self.status_label = ttk.Label(main_container, text="Ready to download", font=('Segoe UI', 9))
-        self.status_label.grid(row=6, column=0, pady=(20, 30))
+        self.status_label = ttk.Label(download_tab, text="Ready to download", font=('Segoe UI', 9))
+        self.status_label.grid(row=4, column=0, pady=(5, 15))
         
-        button_frame = ttk.Frame(main_container)
-        button_frame.grid(row=7, column=0)
+        button_frame = ttk.Frame(download_tab)
+        button_frame.grid(row=5, column=0)
         
         self.download_button = ttk.Button(button_frame, text="Download", command=self.start_download)
         self.download_button.pack(side=tk.LEFT, padx=(0, 16))
@@ -359,6 +628,41 @@ class TubeUI:
         
         self.credits_button = ttk.Button(button_frame, text="Credits", command=self.show_credits)
         self.credits_button.pack(side=tk.LEFT)
+        
+        jobs_toolbar = ttk.Frame(self.jobs_tab)
+        jobs_toolbar.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        jobs_label = ttk.Label(jobs_toolbar, text="Show", font=('Segoe UI', 11))
+        jobs_label.pack(side=tk.LEFT, padx=(0, 16))
+        
+        self.job_filter_var = tk.StringVar(value="All")
+        job_filter_combo = ttk.Combobox(jobs_toolbar, textvariable=self.job_filter_var,
+                                        values=["All"] + [state.capitalize() for state in JOB_STATES],
+                                        state="readonly", width=12)
+        job_filter_combo.pack(side=tk.LEFT, padx=(0, 16))
+        job_filter_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_job_view())
+        
+        for text, command in [("Import URLs", self.import_job_urls),
+                              ("Cancel", self.cancel_selected_jobs),
+                              ("Retry", self.retry_selected_jobs),
+                              ("Remove", self.remove_selected_jobs),
+                              ("Clear Finished", self.clear_finished_jobs)]:
+            ttk.Button(jobs_toolbar, text=text, command=command).pack(side=tk.LEFT, padx=(0, 8))
+        
+        self.job_count_label = ttk.Label(jobs_toolbar, text="0 jobs", font=('Segoe UI', 9))
+        self.job_count_label.pack(side=tk.RIGHT)
+        
+        self.job_tree = ttk.Treeview(self.jobs_tab, columns=[column for column, _, _ in JOB_COLUMNS],
+                                     show='headings', height=12, selectmode='extended')
+        for column, heading, width in JOB_COLUMNS:
+            self.job_tree.heading(column, text=heading, command=lambda c=column: self.sort_jobs(c))
+            self.job_tree.column(column, width=width, stretch=(column == 'title'))
+        self.job_tree.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.job_tree.bind('<Control-a>', self.select_all_jobs)
+        
+        job_scrollbar = ttk.Scrollbar(self.jobs_tab, orient=tk.VERTICAL, command=self.job_tree.yview)
+        job_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.job_tree.configure(yscrollcommand=lambda first, last: self.on_job_tree_scroll(job_scrollbar, first, last))
     
     def show_credits(self):
         credits_text = """Tube UI
@@ -412,6 +716,14 @@ Created: 2025"""
         else:
             self.quality_label.grid()
             self.quality_frame.grid()
+        
+        if format_type == "both":
+            self.extra_outputs_label.grid()
+            self.extra_outputs_frame.grid()
+        else:
+            self.extra_outputs_label.grid_remove()
+            self.extra_outputs_frame.grid_remove()
+        self.show_video_info()
     
     def check_ffmpeg_availability(self):
         if not self.ffmpeg_manager.check_ffmpeg():
@@ -437,34 +749,340 @@ Created: 2025"""
             'quiet': True,
             'no_warnings': True,
             'extract_flat': False,
+            'noplaylist': True,
         }
         
+        # Unprocessed info lets the download reuse this extraction with its own format selection
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
+                info = ydl.extract_info(url, download=False, process=False)
+                
+                # Without processing, yt-dlp hands back redirect stubs (e.g. watch?v=...&list=... with
+                # noplaylist) instead of the video, so follow them the way process_ie_result would
+                for _ in range(MAX_INFO_REDIRECTS):
+                    if info.get('_type') not in ('url', 'url_transparent'):
+                        break
+                    stub = info
+                    info = ydl.extract_info(stub['url'], ie_key=stub.get('ie_key'), download=False, process=False)
+                    if stub['_type'] == 'url_transparent':
+                        for key, value in stub.items():
+                            if value is not None and key not in ('_type', 'url', 'id', 'extractor',
+                                                                 'extractor_key', 'ie_key'):
+                                info[key] = value
                 return info
         except Exception as e:
             raise Exception(f"Failed to get video info: {str(e)}")
     
+    def get_cached_video_info(self, url):
+        with self.info_cache_lock:
+            entry = self.info_cache.get(url)
+            if entry is None:
+                return None
+            cached_at, info = entry
+            if time.time() - cached_at > INFO_CACHE_TTL:
+                del self.info_cache[url]
+                return None
+            self.info_cache.move_to_end(url)
+            return info
+    
+    def cache_video_info(self, url, info):
+        # Playlist entries can be lazy generators, so only single videos are reused
+        if info.get('_type', 'video') != 'video':
+            return
+        with self.info_cache_lock:
+            self.info_cache[url] = (time.time(), info)
+            self.info_cache.move_to_end(url)
+            while len(self.info_cache) > INFO_CACHE_SIZE:
+                self.info_cache.popitem(last=False)
+    
+    def invalidate_video_info(self, url):
+        with self.info_cache_lock:
+            self.info_cache.pop(url, None)
+    
+    def fetch_video_info(self, url):
+        while True:
+            info = self.get_cached_video_info(url)
+            if info is not None:
+                return info
+            
+            with self.info_cache_lock:
+                pending = self.info_fetches.get(url)
+                owner = pending is None
+                if owner:
+                    pending = threading.Event()
+                    self.info_fetches[url] = pending
+            
+            # Another thread (usually the prefetch) is already extracting this URL; wait for it
+            # rather than starting a duplicate, and only extract ourselves if it produced nothing
+            if not owner:
+                pending.wait()
+                continue
+            
+            try:
+                info = self.get_video_info(url)
+                self.cache_video_info(url, info)
+                return info
+            finally:
+                with self.info_cache_lock:
+                    self.info_fetches.pop(url, None)
+                pending.set()
+    
+    def on_url_change(self, *args):
+        if self.prefetch_after_id:
+            self.root.after_cancel(self.prefetch_after_id)
+        
+        # Any extraction still running for the previous text is now stale
+        self.prefetch_generation += 1
+        self.prefetched_info = None
+        self.prefetch_after_id = self.root.after(PREFETCH_DELAY, self.start_prefetch)
+        self.show_video_info()
+    
+    def start_prefetch(self):
+        self.prefetch_after_id = None
+        url = self.url_var.get().strip()
+        if not url or len(url.split()) > 1 or not self.validate_url(url):
+            return
+        
+        info = self.get_cached_video_info(url)
+        if info is not None:
+            self.prefetched_info = info
+            self.show_video_info()
+            return
+        
+        generation = self.prefetch_generation
+        self.video_info_label.config(text="Fetching video info...", foreground="gray")
+        
+        thread = threading.Thread(target=self.prefetch_worker, args=(url, generation))
+        thread.daemon = True
+        thread.start()
+    
+    def prefetch_worker(self, url, generation):
+        try:
+            info = self.fetch_video_info(url)
+            self.root.after(0, self.prefetch_complete, generation, info, None)
+        except Exception as e:
+            self.root.after(0, self.prefetch_complete, generation, None, str(e))
+    
+    def prefetch_complete(self, generation, info, error):
+        if generation != self.prefetch_generation:
+            return
+        
+        if error:
+            self.video_info_label.config(text=error, foreground="red")
+            return
+        
+        self.prefetched_info = info
+        self.show_video_info()
+    
+    def available_qualities(self, info):
+        heights = [f.get('height') for f in info.get('formats') or []
+                   if f.get('height') and f.get('vcodec') != 'none']
+        if not heights:
+            return list(VIDEO_QUALITIES)
+        
+        max_height = max(heights)
+        qualities = [q for q in VIDEO_QUALITIES if VIDEO_QUALITY_HEIGHTS[q] <= max_height]
+        return qualities or [VIDEO_QUALITIES[-1]]
+    
+    def estimate_format_size(self, fmt, duration):
+        size = fmt.get('filesize') or fmt.get('filesize_approx')
+        if not size and fmt.get('tbr') and duration:
+            size = fmt['tbr'] * 1000 / 8 * duration
+        return size or 0
+    
+    def estimate_download_size(self, info, format_type, quality):
+        formats = info.get('formats') or []
+        duration = info.get('duration')
+        
+        audio_formats = [f for f in formats if f.get('acodec') not in (None, 'none') and f.get('vcodec') == 'none']
+        best_audio = max(audio_formats, key=lambda f: f.get('abr') or f.get('tbr') or 0, default=None)
+        audio_size = self.estimate_format_size(best_audio, duration) if best_audio else 0
+        if format_type == "mp3":
+            return audio_size
+        
+        max_height = VIDEO_QUALITY_HEIGHTS.get(quality, 1080)
+        video_formats = [f for f in formats if f.get('vcodec') not in (None, 'none')
+                         and f.get('height') and f['height'] <= max_height]
+        best_video = max(video_formats, key=lambda f: (f['height'], f.get('tbr') or 0), default=None)
+        if best_video is None:
+            return 0
+        return self.estimate_format_size(best_video, duration) + audio_size
+    
+    def show_video_info(self):
+        info = self.prefetched_info
+        if info is None:
+            self.quality_combo.config(values=VIDEO_QUALITIES)
+            self.video_info_label.config(text="")
+            return
+        
+        qualities = self.available_qualities(info)
+        self.quality_combo.config(values=qualities)
+        if self.quality_var.get() not in qualities:
+            self.quality_var.set(qualities[0])
+        
+        details = [info.get('title', 'video')]
+        duration = info.get('duration')
+        if duration:
+            minutes, seconds = divmod(int(duration), 60)
+            details.append(f"{minutes}:{seconds:02d}")
+        size = self.estimate_download_size(info, self.format_var.get(), self.quality_var.get())
+        if size:
+            details.append(f"~{format_size(size)}")
+        self.video_info_label.config(text="  •  ".join(details), foreground="green")
+    
+    def profile_phase(self, name):
+        if self.profiler:
+            return self.profiler.phase(name)
+        return contextlib.nullcontext()
+    
+    def run_ffmpeg(self, cmd, label, duration=None):
+        cmd = cmd[:1] + ['-progress', 'pipe:1', '-nostats'] + cmd[1:]
+        if self.profiler:
+            cmd = cmd[:1] + ['-benchmark'] + cmd[1:]
+        
+        start = time.perf_counter()
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   text=True, encoding='utf-8', errors='replace')
+        
+        # stderr is only needed for error messages, so keep just its tail
+        stderr_tail = collections.deque(maxlen=FFMPEG_STDERR_LINES)
+        stderr_thread = threading.Thread(target=stderr_tail.extend, args=(process.stderr,))
+        stderr_thread.daemon = True
+        stderr_thread.start()
+        
+        progress_lines = queue.Queue()
+        
+        def read_progress():
+            for line in process.stdout:
+                progress_lines.put(line)
+            progress_lines.put(None)
+        
+        stdout_thread = threading.Thread(target=read_progress)
+        stdout_thread.daemon = True
+        stdout_thread.start()
+        
+        progress = {}
+        last_block = None
+        last_change = time.monotonic()
+        abort_reason = None
+        
+        while True:
+            try:
+                line = progress_lines.get(timeout=0.5)
+            except queue.Empty:
+                line = ''
+            if line is None:
+                break
+            
+            key, sep, value = line.strip().partition('=')
+            if sep:
+                progress[key] = value
+                # Each -progress block ends with a "progress=" line
+                if key == 'progress':
+                    block = (progress.get('out_time_us'), progress.get('total_size'), progress.get('frame'))
+                    if block != last_block:
+                        last_block = block
+                        last_change = time.monotonic()
+                    self.report_transcode_progress(progress, duration)
+            
+            job = self.current_job
+            if job and job.cancel_requested:
+                abort_reason = "FFmpeg cancelled"
+                break
+            if time.monotonic() - last_change > FFMPEG_STALL_TIMEOUT:
+                abort_reason = f"FFmpeg stalled: no progress for {FFMPEG_STALL_TIMEOUT} seconds"
+                break
+        
+        if abort_reason:
+            process.kill()
+        process.wait()
+        stderr_thread.join(timeout=5)
+        
+        result = subprocess.CompletedProcess(
+            cmd, process.returncode,
+            stdout="\n".join(f"{key}={value}" for key, value in progress.items()),
+            stderr="".join(stderr_tail),
+        )
+        
+        if self.profiler:
+            self.profiler.record_ffmpeg(label, cmd, result, time.perf_counter() - start)
+        
+        if abort_reason:
+            raise FFmpegAborted(abort_reason)
+        
+        return result
+    
+    def report_transcode_progress(self, progress, duration):
+        percent = None
+        out_time_us = progress.get('out_time_us', '')
+        if progress.get('progress') == 'end':
+            percent = 100.0
+        elif duration and out_time_us.isdigit():
+            percent = min(100.0, int(out_time_us) / 1000000 / duration * 100)
+        speed = progress.get('speed', 'N/A').strip()
+        
+        job = self.current_job
+        if job:
+            with self.jobs_lock:
+                job.state = 'processing'
+                if percent is not None:
+                    job.progress = percent
+                self.dirty_jobs.add(job.id)
+        
+        self.root.after(0, self.show_transcode_progress, percent, speed)
+    
+    def show_transcode_progress(self, percent, speed):
+        text = "Converting..."
+        if percent is not None:
+            self.progress_var.set(percent)
+            text = f"Converting... {percent:.0f}%"
+        if speed and speed != 'N/A':
+            text = f"{text} ({speed})"
+        self.status_label.config(text=text, foreground="blue")
+    
     def download_progress_hook(self, d):
+        job = self.current_job
+        if job and job.cancel_requested:
+            raise yt_dlp.utils.DownloadCancelled("Cancelled by user")
+        
         if d['status'] == 'downloading':
             if 'total_bytes' in d and d['total_bytes'] > 0:
                 percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
                 self.progress_var.set(percent)
+                self.update_job_progress(job, percent)
                 self.root.update_idletasks()
         elif d['status'] == 'finished':
             self.progress_var.set(100)
+            self.update_job_progress(job, 100)
             self.root.update_idletasks()
     
-    def download_video(self, url, output_path, format_type, quality):
+    def update_job_progress(self, job, percent):
+        # Only mark the row dirty when the displayed whole percentage changes
+        if job and int(percent) != int(job.progress):
+            job.progress = percent
+            self.mark_job_dirty(job)
+    
+    def remove_files(self, paths):
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def download_video(self, url, output_path, format_type, quality, audio_format='mp3', thumbnail=False):
         try:
             if not self.ffmpeg_manager.check_ffmpeg():
                 self.status_label.config(text="FFmpeg not found. Please install FFmpeg manually or try again.", foreground="red")
                 return False, "FFmpeg required but not available. Please install FFmpeg manually."
             
-            info = self.get_video_info(url)
+            with self.profile_phase('extract'):
+                info = self.fetch_video_info(url)
             title = info.get('title', 'video')
+            duration = info.get('duration')
             safe_title = re.sub(r'[<>:"/\\|?*]', '', title)
+            if self.profiler:
+                self.profiler.job_name = title
+            if self.current_job:
+                self.current_job.title = title
+                self.mark_job_dirty(self.current_job)
             
             ffmpeg_location = None
             if self.ffmpeg_manager.ffmpeg_path and self.ffmpeg_manager.ffmpeg_path != 'ffmpeg':
@@ -501,6 +1119,11 @@ Created: 2025"""
                     'merge_output_format': 'mp4',
                     'postprocessors': [],
                 }
+                
+                if format_type == "both":
+                    # Keep a single local copy of the streams; MKV accepts any codec so merging is a plain remux
+                    ydl_opts['outtmpl'] = os.path.join(output_path, f'{safe_title}_source.%(ext)s')
+                    ydl_opts['merge_output_format'] = 'mkv'
             
             if ffmpeg_location:
                 ydl_opts['ffmpeg_location'] = ffmpeg_location
@@ -522,11 +1145,17 @@ Created: 2025"""
                 'format_sort_force': True,
             })
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            with self.profile_phase('download'):
+                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                    if info.get('_type', 'video') == 'video':
+                        # Reuse the extraction instead of letting yt-dlp fetch the page again
+                        ydl.process_ie_result(copy.deepcopy(info), download=True)
+                    else:
+                        ydl.download([url])
             
             if format_type == "mp3":
                 # Convert downloaded audio to MP3
+                mp3_file = os.path.join(output_path, f'{safe_title}.mp3')
                 try:
                     audio_file = None
                     for ext in ['.m4a', '.webm', '.ogg', '.opus', '.mp3']:
@@ -536,8 +1165,6 @@ Created: 2025"""
                             break
                     
                     if audio_file:
-                        mp3_file = os.path.join(output_path, f'{safe_title}.mp3')
-                        
                         # Convert audio to MP3 with better OPUS handling
                         cmd = [
                             self.ffmpeg_manager.ffmpeg_path,
@@ -552,7 +1179,8 @@ Created: 2025"""
                             mp3_file
                         ]
                         
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                        with self.profile_phase('convert-mp3'):
+                            result = self.run_ffmpeg(cmd, 'convert-mp3', duration)
                         
                         if result.returncode == 0:
                             # Remove original audio file
@@ -571,7 +1199,8 @@ Created: 2025"""
                                 mp3_file
                             ]
                             
-                            alt_result = subprocess.run(alt_cmd, capture_output=True, text=True, timeout=300)
+                            with self.profile_phase('convert-mp3-alt'):
+                                alt_result = self.run_ffmpeg(alt_cmd, 'convert-mp3-alt', duration)
                             
                             if alt_result.returncode == 0:
                                 os.remove(audio_file)
@@ -580,12 +1209,120 @@ Created: 2025"""
                                 return False, f"Audio conversion failed: {result.stderr}\nAlternative also failed: {alt_result.stderr}"
                     else:
                         return False, "Could not find downloaded audio file"
-                        
+                
+                except FFmpegAborted as e:
+                    if os.path.exists(mp3_file):
+                        os.remove(mp3_file)
+                    return False, f"Audio conversion aborted: {str(e)}"
                 except Exception as e:
                     return False, f"Audio processing failed: {str(e)}"
             
+            if format_type == "both":
+                # Derive every output from the one download in a single FFmpeg run so the
+                # source is read and decoded once
+                output_files = []
+                try:
+                    source_file = None
+                    for ext in ['.mkv', '.mp4', '.webm']:
+                        potential_file = os.path.join(output_path, f'{safe_title}_source{ext}')
+                        if os.path.exists(potential_file):
+                            source_file = potential_file
+                            break
+                    
+                    if not source_file:
+                        return False, "Could not find downloaded video file"
+                    
+                    cmd = [
+                        self.ffmpeg_manager.ffmpeg_path,
+                        '-i', source_file,
+                    ]
+                    
+                    # The thumbnail filter only considers a batch of 100 frames (a few seconds), so
+                    # point it past the intro with a second, input-seeked reference to the same file.
+                    # Input seeking jumps to a keyframe without decoding anything before it.
+                    thumbnail_input = '0:v:0'
+                    if thumbnail and duration:
+                        cmd += ['-ss', f'{min(duration * 0.2, 120):.2f}', '-i', source_file]
+                        thumbnail_input = '1:v:0'
+                    
+                    cmd += [
+                        '-y',
+                        # MP4: copy video, AAC audio for Windows compatibility
+                        '-map', '0:v:0', '-map', '0:a:0',
+                        '-c:v', 'copy',
+                        '-c:a', 'aac',
+                        '-b:a', '192k',
+                        '-ar', '44100',
+                        os.path.join(output_path, f'{safe_title}.mp4'),
+                    ]
+                    outputs = ["MP4"]
+                    output_files.append(cmd[-1])
+                    
+                    # The M4A is remuxed from the MP4's AAC track afterwards rather than encoded twice
+                    if audio_format != "m4a":
+                        cmd += [
+                            '-map', '0:a:0',
+                            '-vn',
+                            '-acodec', 'mp3',
+                            '-ab', '192k',
+                            '-ar', '44100',
+                            '-ac', '2',
+                            '-avoid_negative_ts', 'make_zero',
+                            os.path.join(output_path, f'{safe_title}.mp3'),
+                        ]
+                        outputs.append("MP3")
+                        output_files.append(cmd[-1])
+                    
+                    if thumbnail:
+                        cmd += [
+                            '-map', thumbnail_input,
+                            '-vf', 'thumbnail',  # Best-looking frame of the next 100
+                            '-frames:v', '1',
+                            '-q:v', '2',
+                            os.path.join(output_path, f'{safe_title}.jpg'),
+                        ]
+                        outputs.append("thumbnail")
+                        output_files.append(cmd[-1])
+                    
+                    with self.profile_phase('multi-output'):
+                        result = self.run_ffmpeg(cmd, 'multi-output', duration)
+                    
+                    if result.returncode == 0 and audio_format == "m4a":
+                        m4a_file = os.path.join(output_path, f'{safe_title}.m4a')
+                        output_files.append(m4a_file)
+                        m4a_cmd = [
+                            self.ffmpeg_manager.ffmpeg_path,
+                            '-i', output_files[0],
+                            '-y',
+                            '-map', '0:a:0',
+                            '-vn',
+                            '-c:a', 'copy',
+                            m4a_file,
+                        ]
+                        
+                        with self.profile_phase('remux-m4a'):
+                            result = self.run_ffmpeg(m4a_cmd, 'remux-m4a', duration)
+                        outputs.append("M4A")
+                    
+                    if result.returncode != 0:
+                        self.remove_files(output_files)
+                        return False, f"Post-processing failed: {result.stderr}"
+                    
+                    os.remove(source_file)
+                    return True, f"Successfully downloaded: {title} ({', '.join(outputs)})"
+                
+                # Keep the downloaded source on failure; only the half-written outputs are discarded
+                except FFmpegAborted as e:
+                    self.remove_files(output_files)
+                    return False, f"Post-processing aborted: {str(e)}"
+                except Exception as e:
+                    self.remove_files(output_files)
+                    return False, f"Post-processing failed: {str(e)}"
+            
             # For MP4, convert OPUS to AAC if needed for Windows compatibility
+            conversion_note = ""
             if format_type == "mp4":
+                temp_file = os.path.join(output_path, f'{safe_title}_temp.mp4')
                 try:
                     downloaded_file = None
                     for ext in ['.mp4', '.webm', '.mkv']:
@@ -596,8 +1333,6 @@ Created: 2025"""
                     
                     if downloaded_file:
                         # Always convert audio to AAC for Windows compatibility
-                        temp_file = os.path.join(output_path, f'{safe_title}_temp.mp4')
-                        
                         cmd = [
                             self.ffmpeg_manager.ffmpeg_path,
                             '-i', downloaded_file,
@@ -609,7 +1344,8 @@ Created: 2025"""
                             temp_file
                         ]
                         
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                        with self.profile_phase('convert-aac'):
+                            result = self.run_ffmpeg(cmd, 'convert-aac', duration)
                         
                         if result.returncode == 0:
                             # Replace original file with converted one
@@ -619,26 +1355,42 @@ Created: 2025"""
                             # Clean up temp file if conversion failed
                             if os.path.exists(temp_file):
                                 os.remove(temp_file)
+                            conversion_note = " (audio conversion failed, original audio kept)"
+                except FFmpegAborted as e:
+                    if os.path.exists(temp_file):
+                        os.remove(temp_file)
+                    return False, f"Audio conversion aborted: {str(e)}. The unconverted file was kept."
                 except Exception as e:
-                    pass  # Don't fail the download if audio conversion fails
+                    # Don't fail the download if audio conversion fails
+                    conversion_note = f" (audio conversion failed: {str(e)})"
             
-            return True, f"Successfully downloaded: {title}"
+            return True, f"Successfully downloaded: {title}{conversion_note}"
             
         except Exception as e:
             return False, f"Download failed: {str(e)}"
     
     def start_download(self):
-        if self.is_downloading:
-            messagebox.showwarning("Warning", "Download in progress. Please wait.")
+        text = self.url_entry.get().strip()
+        if not text:
+            messagebox.showerror("Error", "Please enter a video URL")
             return
         
-        url = self.url_entry.get().strip()
-        if not url:
-            messagebox.showerror("Error", "Please enter a video URL")
+        urls = text.split()
+        invalid = [url for url in urls if not self.validate_url(url)]
+        if invalid:
+            messagebox.showerror("Error", f"Invalid video URL: {invalid[0]}" if len(urls) > 1 else "Invalid video URL")
+            return
+        
+        output_path = self.path_entry.get().strip()
+        if not os.path.exists(output_path):
+            messagebox.showerror("Error", "Download path does not exist")
             return
         
-        if not self.validate_url(url):
-            messagebox.showerror("Error", "Invalid video URL")
+        self.add_jobs(urls, output_path)
+    
+    def import_job_urls(self):
+        file_path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not file_path:
             return
         
         output_path = self.path_entry.get().strip()
@@ -646,38 +1398,415 @@ Created: 2025"""
             messagebox.showerror("Error", "Download path does not exist")
             return
         
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                urls = [line.strip() for line in f if self.validate_url(line.strip())]
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to read URL list: {str(e)}")
+            return
+        
+        if not urls:
+            messagebox.showerror("Error", "No valid video URLs found in file")
+            return
+        
+        self.add_jobs(urls, output_path)
+    
+    def add_jobs(self, urls, output_path):
         format_type = self.format_var.get()
-        quality = self.quality_var.get() if format_type == "mp4" else None
+        quality = self.quality_var.get() if format_type in ("mp4", "both") else None
+        profile = self.profiling_var.get()
+        audio_format = self.audio_format_var.get()
+        thumbnail = self.thumbnail_var.get()
+        
+        new_jobs = []
+        with self.jobs_lock:
+            for url in urls:
+                job = DownloadJob(self.next_job_id, url, output_path, format_type, quality, profile,
+                                  audio_format, thumbnail)
+                self.next_job_id += 1
+                self.jobs[job.id] = job
+                self.job_order.append(job.id)
+                self.pending_jobs.append(job.id)
+                new_jobs.append(job)
+        
+        # A batch is easier to follow from the job table than from the single status line
+        if len(new_jobs) > 1:
+            self.notebook.select(self.jobs_tab)
+        
+        if len(new_jobs) > JOB_ROW_CHUNK:
+            self.refresh_job_view(keep_position=True)
+        else:
+            for job in new_jobs:
+                self.mark_job_dirty(job)
+        
+        self.start_queue()
+    
+    def start_queue(self):
+        if self.is_downloading or not self.pending_jobs:
+            return
         
         self.is_downloading = True
-        self.download_button.config(state='disabled')
         self.status_label.config(text="Downloading...", foreground="blue")
         self.progress_var.set(0)
         
-        thread = threading.Thread(target=self.download_worker, 
-                                args=(url, output_path, format_type, quality))
+        thread = threading.Thread(target=self.queue_worker)
         thread.daemon = True
         thread.start()
     
-    def download_worker(self, url, output_path, format_type, quality):
-        try:
-            success, message = self.download_video(url, output_path, format_type, quality)
+    def next_queued_job(self):
+        with self.jobs_lock:
+            while self.pending_jobs:
+                job = self.jobs.get(self.pending_jobs.popleft())
+                if job and job.state == 'queued':
+                    job.state = 'downloading'
+                    job.progress = 0.0
+                    self.dirty_jobs.add(job.id)
+                    return job
+        return None
+    
+    def queue_worker(self):
+        while True:
+            job = self.next_queued_job()
+            if job is None:
+                break
             
-            self.root.after(0, self.download_complete, success, message)
+            self.current_job = job
+            self.root.after(0, self.job_started, job)
+            success, message = self.download_worker(job)
+            self.current_job = None
+            
+            with self.jobs_lock:
+                if job.cancel_requested:
+                    job.state = 'cancelled'
+                elif success:
+                    job.state = 'done'
+                    job.progress = 100.0
+                else:
+                    job.state = 'failed'
+                job.message = message
+                self.dirty_jobs.add(job.id)
             
+            self.root.after(0, self.job_finished, job)
+        
+        self.root.after(0, self.download_complete)
+    
+    def download_worker(self, job):
+        if job.profile:
+            self.profiler = JobProfiler(job.url, self.profiles_dir)
+            self.profiler.start()
+        
+        try:
+            success, message = self.download_video(job.url, job.output_path, job.format_type, job.quality,
+                                                   job.audio_format, job.thumbnail)
         except Exception as e:
-            self.root.after(0, self.download_complete, False, f"Error: {str(e)}")
+            success, message = False, f"Error: {str(e)}"
+        
+        # Cached stream URLs are signed and expire, so a retry after a failure must extract afresh
+        if not success:
+            self.invalidate_video_info(job.url)
+        
+        if self.profiler:
+            profiler = self.profiler
+            self.profiler = None
+            profiler.stop()
+            try:
+                report_path = profiler.write_report("success" if success else message)
+                message = f"{message}\nProfile saved to {report_path}"
+            except Exception as e:
+                message = f"{message}\nFailed to write profile report: {str(e)}"
+        
+        return success, message
+    
+    def job_started(self, job):
+        self.progress_var.set(0)
+        # pending_jobs can still hold ids of cancelled or removed jobs, so count by state
+        with self.jobs_lock:
+            remaining = sum(1 for queued_job in self.jobs.values() if queued_job.state == 'queued')
+        suffix = f" ({remaining} queued)" if remaining else ""
+        self.status_label.config(text=f"Downloading: {job.title}{suffix}", foreground="blue")
     
-    def download_complete(self, success, message):
+    def job_finished(self, job):
+        self.run_counts[job.state] += 1
+        self.last_message = job.message
+        color = {'done': "green", 'failed': "red"}.get(job.state, "orange")
+        self.status_label.config(text=job.message.splitlines()[0] if job.message else job.state.capitalize(),
+                                 foreground=color)
+    
+    def download_complete(self):
         self.is_downloading = False
-        self.download_button.config(state='normal')
         
-        if success:
-            self.status_label.config(text=message, foreground="green")
-            messagebox.showinfo("Success", message)
+        # Jobs added after the worker found the queue empty still need to run
+        if self.pending_jobs:
+            self.start_queue()
+            return
+        
+        counts = self.run_counts
+        finished = sum(counts.values())
+        self.run_counts = collections.Counter()
+        
+        if finished == 1:
+            if counts['done']:
+                self.status_label.config(text=self.last_message, foreground="green")
+                messagebox.showinfo("Success", self.last_message)
+            elif counts['failed']:
+                self.status_label.config(text=self.last_message, foreground="red")
+                messagebox.showerror("Error", self.last_message)
+        elif finished > 1:
+            summary = f"{counts['done']} done, {counts['failed']} failed, {counts['cancelled']} cancelled"
+            color = "green" if not counts['failed'] else "orange"
+            self.status_label.config(text=f"Queue finished: {summary}", foreground=color)
+            messagebox.showinfo("Queue Finished", f"Finished {finished} jobs: {summary}")
+    
+    def mark_job_dirty(self, job):
+        with self.jobs_lock:
+            self.dirty_jobs.add(job.id)
+    
+    def job_matches_filter(self, job):
+        job_filter = self.job_filter_var.get().lower()
+        return job_filter == 'all' or job.state == job_filter
+    
+    def job_sort_key(self, column):
+        if column == 'state':
+            return lambda job: JOB_STATES.index(job.state)
+        if column == 'progress':
+            return lambda job: job.progress
+        if column == 'quality':
+            return lambda job: VIDEO_QUALITIES.index(job.quality) if job.quality in VIDEO_QUALITIES else len(VIDEO_QUALITIES)
+        if column == 'format':
+            return lambda job: job.format_label()
+        return lambda job: job.title.lower()
+    
+    def sort_jobs(self, column):
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
         else:
-            self.status_label.config(text=message, foreground="red")
-            messagebox.showerror("Error", message)
+            self.sort_column = column
+            self.sort_reverse = False
+        self.refresh_job_view()
+    
+    def refresh_job_view(self, keep_position=False):
+        # Bulk updates rebuild the view; carry the selection and scroll position across
+        restore = None
+        if keep_position:
+            restore = (set(self.job_tree.selection()), self.job_tree.yview()[0])
+        
+        with self.jobs_lock:
+            visible = [self.jobs[job_id] for job_id in self.job_order if self.job_matches_filter(self.jobs[job_id])]
+            self.dirty_jobs.clear()
+        
+        if self.sort_column:
+            visible.sort(key=self.job_sort_key(self.sort_column), reverse=self.sort_reverse)
+        
+        # Bumping the generation aborts any chunked insert still in flight from a previous refresh
+        self.view_generation += 1
+        self.job_tree.delete(*self.job_tree.get_children())
+        self.row_values.clear()
+        self.stale_rows.clear()
+        self.view_order = [str(job.id) for job in visible]
+        self.view_ids = set(self.view_order)
+        self.rows_inserted = 0
+        self.insert_job_rows(self.view_generation, restore)
+        self.update_job_count()
+    
+    def insert_job_rows(self, generation, restore=None):
+        # The tree always holds exactly view_order[:rows_inserted]; each pass appends the next chunk
+        if generation != self.view_generation:
+            return
+        
+        end = min(self.rows_inserted + JOB_ROW_CHUNK, len(self.view_order))
+        chunk = self.view_order[self.rows_inserted:end]
+        for iid in chunk:
+            values = self.jobs[int(iid)].row_values()
+            self.job_tree.insert('', tk.END, iid=iid, values=values)
+            self.row_values[iid] = values
+        self.rows_inserted = end
+        
+        if restore:
+            selected = [iid for iid in chunk if iid in restore[0]]
+            if selected:
+                self.job_tree.selection_add(selected)
+        
+        if end < len(self.view_order):
+            self.root.after(1, self.insert_job_rows, generation, restore)
+        elif restore:
+            self.job_tree.yview_moveto(restore[1])
+    
+    def sorted_view_index(self, job):
+        if not self.sort_column:
+            return len(self.view_order)
+        
+        sort_key = self.job_sort_key(self.sort_column)
+        job_key = sort_key(job)
+        low, high = 0, len(self.view_order)
+        while low < high:
+            mid = (low + high) // 2
+            mid_key = sort_key(self.jobs[int(self.view_order[mid])])
+            if (mid_key < job_key) if self.sort_reverse else (mid_key > job_key):
+                high = mid
+            else:
+                low = mid + 1
+        return low
+    
+    def place_job_rows(self, jobs):
+        if not self.sort_column:
+            for job in jobs:
+                iid = str(job.id)
+                if iid in self.view_ids:
+                    self.stale_rows.add(iid)
+                else:
+                    self.insert_view_row(job, False)
+            return
+        
+        # Pull every changed row out before placing any of them, so each binary search runs
+        # over a view that is still sorted. Rows already in the tree are parked at its end
+        # (moving keeps their selection) until they are placed.
+        iids = {str(job.id) for job in jobs}
+        in_tree = [iid for iid in self.view_order[:self.rows_inserted] if iid in iids]
+        for iid in in_tree:
+            self.job_tree.move(iid, '', 'end')
+        self.rows_inserted -= len(in_tree)
+        self.view_order = [iid for iid in self.view_order if iid not in iids]
+        
+        in_tree = set(in_tree)
+        for job in jobs:
+            self.insert_view_row(job, str(job.id) in in_tree)
+    
+    def insert_view_row(self, job, in_tree):
+        iid = str(job.id)
+        self.view_ids.add(iid)
+        index = self.sorted_view_index(job)
+        self.view_order.insert(index, iid)
+        if index <= self.rows_inserted:
+            if in_tree:
+                self.job_tree.move(iid, '', index)
+                self.stale_rows.add(iid)
+            else:
+                values = job.row_values()
+                self.job_tree.insert('', index, iid=iid, values=values)
+                self.row_values[iid] = values
+            self.rows_inserted += 1
+        elif in_tree:
+            # Moved into the part of the view the chunked insert hasn't reached yet
+            self.job_tree.delete(iid)
+            self.row_values.pop(iid, None)
+    
+    def drop_job_rows(self, iids):
+        iids = set(iids) & self.view_ids
+        if not iids:
+            return
+        
+        in_tree = [iid for iid in self.view_order[:self.rows_inserted] if iid in iids]
+        if in_tree:
+            self.job_tree.delete(*in_tree)
+        self.rows_inserted -= len(in_tree)
+        self.view_order = [iid for iid in self.view_order if iid not in iids]
+        for iid in iids:
+            self.view_ids.discard(iid)
+            self.row_values.pop(iid, None)
+            self.stale_rows.discard(iid)
+    
+    def flush_job_updates(self):
+        with self.jobs_lock:
+            dirty = self.dirty_jobs
+            self.dirty_jobs = set()
+        
+        # Rebuilding is cheaper than thousands of single-row inserts and deletes
+        if len(dirty) > JOB_ROW_CHUNK:
+            self.refresh_job_view(keep_position=True)
+            dirty = set()
+        
+        placed = []
+        dropped = []
+        for job_id in dirty:
+            job = self.jobs.get(job_id)
+            if job is None:
+                continue
+            
+            if self.job_matches_filter(job):
+                placed.append(job)
+            else:
+                dropped.append(str(job_id))
+        self.drop_job_rows(dropped)
+        self.place_job_rows(placed)
+        
+        if dirty:
+            self.update_job_count()
+        self.redraw_visible_rows()
+        self.root.after(JOB_FLUSH_INTERVAL, self.flush_job_updates)
+    
+    def redraw_visible_rows(self):
+        # Rows scrolled out of view keep their pending update until they become visible again
+        for iid in list(self.stale_rows):
+            if not self.job_tree.exists(iid):
+                self.stale_rows.discard(iid)
+                continue
+            if not self.job_tree.bbox(iid):
+                continue
+            
+            self.stale_rows.discard(iid)
+            values = self.jobs[int(iid)].row_values()
+            if values != self.row_values.get(iid):
+                self.job_tree.item(iid, values=values)
+                self.row_values[iid] = values
+    
+    def on_job_tree_scroll(self, scrollbar, first, last):
+        scrollbar.set(first, last)
+        if self.stale_rows:
+            self.root.after_idle(self.redraw_visible_rows)
+    
+    def update_job_count(self):
+        total = len(self.jobs)
+        shown = len(self.view_ids)
+        text = f"{total} jobs" if shown == total else f"{shown} of {total} jobs"
+        self.job_count_label.config(text=text)
+        self.notebook.tab(self.jobs_tab, text=f"Jobs ({total})" if total else "Jobs")
+    
+    def select_all_jobs(self, event=None):
+        self.job_tree.selection_set(self.job_tree.get_children())
+        return 'break'
+    
+    def selected_jobs(self):
+        return [self.jobs[int(iid)] for iid in self.job_tree.selection() if int(iid) in self.jobs]
+    
+    def cancel_selected_jobs(self):
+        with self.jobs_lock:
+            for job in self.selected_jobs():
+                if job.state == 'queued':
+                    job.state = 'cancelled'
+                    self.dirty_jobs.add(job.id)
+                elif job.state in ('downloading', 'processing'):
+                    job.cancel_requested = True
+    
+    def retry_selected_jobs(self):
+        with self.jobs_lock:
+            for job in self.selected_jobs():
+                if job.state in ('failed', 'cancelled'):
+                    job.state = 'queued'
+                    job.progress = 0.0
+                    job.message = ''
+                    job.cancel_requested = False
+                    self.pending_jobs.append(job.id)
+                    self.dirty_jobs.add(job.id)
+        self.start_queue()
+    
+    def remove_selected_jobs(self):
+        self.remove_jobs([job for job in self.selected_jobs() if job.state not in ('downloading', 'processing')])
+    
+    def clear_finished_jobs(self):
+        self.remove_jobs([job for job in self.jobs.values() if job.state == 'done'])
+    
+    def remove_jobs(self, jobs):
+        if not jobs:
+            return
+        
+        removed = {job.id for job in jobs}
+        with self.jobs_lock:
+            for job_id in removed:
+                del self.jobs[job_id]
+            self.job_order = [job_id for job_id in self.job_order if job_id not in removed]
+        
+        self.drop_job_rows([str(job_id) for job_id in removed])
+        self.update_job_count()
     
     def install_ffmpeg_manual(self):
         self.status_label.config(text="Installing FFmpeg...", foreground="blue")